@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class Break(Expr):
     """A break expression"""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create a new break expression.
 
@@ -39,3 +39,22 @@ def test_break():
     assert actual == expected
     assert breakBlocks == [actual]
     assert continueBlocks == []
+
+
+def test_break_reused():
+
+    expr = Break()
+
+    # the same expression may appear in multiple loops compiled with the same options, and each
+    # loop must receive its own break block
+    options.enterLoop()
+    first, _ = expr.__teal__(options)
+    firstBreakBlocks, _ = options.exitLoop()
+
+    options.enterLoop()
+    second, _ = expr.__teal__(options)
+    secondBreakBlocks, _ = options.exitLoop()
+
+    assert first is not second
+    assert len(firstBreakBlocks) == 1 and firstBreakBlocks[0] is first
+    assert len(secondBreakBlocks) == 1 and secondBreakBlocks[0] is second
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 class Expr(ABC):
     """Abstract base class for PyTeal expressions."""
 
+    # subclasses which do not declare __slots__ still get a __dict__ as usual
+    __slots__ = ("trace",)
+
     def __init__(self):
         import traceback
 
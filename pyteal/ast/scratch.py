@@ -1,21 +1,25 @@
 from typing import TYPE_CHECKING
+from itertools import count
 
 from ..types import TealType
 from ..config import NUM_SLOTS
 from ..errors import TealInputError
 from .expr import Expr
+from ..ir import TealOp, Op, TealBlock
 
 if TYPE_CHECKING:
     from ..compiler import CompileOptions
 
+# Unique identifier for the compiler to automatically assign slots
+# The id field is used by the compiler to map to an actual slot in the source code
+# Slot ids under 256 are manually reserved slots
+_nextSlotId = count(NUM_SLOTS)
+
 
 class ScratchSlot:
     """Represents the allocation of a scratch space slot."""
 
-    # Unique identifier for the compiler to automatically assign slots
-    # The id field is used by the compiler to map to an actual slot in the source code
-    # Slot ids under 256 are manually reserved slots
-    nextSlotId = NUM_SLOTS
+    __slots__ = ("id", "isReservedSlot", "_hash")
 
     def __init__(self, requestedSlotId: int = None):
         """Initializes a scratch slot with a particular id
@@ -25,19 +29,19 @@ class ScratchSlot:
             This id may be a Python int in the range [0-256).
         """
         if requestedSlotId is None:
-            self.id = ScratchSlot.nextSlotId
-            ScratchSlot.nextSlotId += 1
+            self.id = next(_nextSlotId)
             self.isReservedSlot = False
         else:
-            if requestedSlotId < 0 or requestedSlotId >= NUM_SLOTS:
+            if not 0 <= requestedSlotId < NUM_SLOTS:
                 raise TealInputError(
-                    "Invalid slot ID {}, shoud be in [0, {})".format(
-                        requestedSlotId, NUM_SLOTS
-                    )
+                    f"Invalid slot ID {requestedSlotId}, should be in [0, {NUM_SLOTS})"
                 )
             self.id = requestedSlotId
             self.isReservedSlot = True
 
+        # slots are used as dictionary keys throughout the compiler, so only hash the id once
+        self._hash = hash(self.id)
+
     def store(self, value: Expr = None) -> Expr:
         """Get an expression to store a value in this slot.
 
@@ -60,13 +64,13 @@ class ScratchSlot:
         return ScratchLoad(self, type)
 
     def __repr__(self):
-        return "ScratchSlot({})".format(self.id)
+        return f"ScratchSlot({self.id})"
 
     def __str__(self):
-        return "slot#{}".format(self.id)
+        return f"slot#{self.id}"
 
     def __hash__(self):
-        return hash(self.id)
+        return self._hash
 
 
 ScratchSlot.__module__ = "pyteal"
@@ -75,6 +79,8 @@ ScratchSlot.__module__ = "pyteal"
 class ScratchLoad(Expr):
     """Expression to load a value from scratch space."""
 
+    __slots__ = ("slot", "type")
+
     def __init__(self, slot: ScratchSlot, type: TealType = TealType.anytype):
         """Create a new ScratchLoad expression.
 
@@ -88,11 +94,9 @@ class ScratchLoad(Expr):
         self.type = type
 
     def __str__(self):
-        return "(Load {})".format(self.slot)
+        return f"(Load {self.slot})"
 
     def __teal__(self, options: "CompileOptions"):
-        from ..ir import TealOp, Op, TealBlock
-
         op = TealOp(self, Op.load, self.slot)
         return TealBlock.FromOp(options, op)
 
@@ -109,6 +113,8 @@ ScratchLoad.__module__ = "pyteal"
 class ScratchStore(Expr):
     """Expression to store a value in scratch space."""
 
+    __slots__ = ("slot", "value")
+
     def __init__(self, slot: ScratchSlot, value: Expr):
         """Create a new ScratchStore expression.
 
@@ -121,11 +127,9 @@ class ScratchStore(Expr):
         self.value = value
 
     def __str__(self):
-        return "(Store {} {})".format(self.slot, self.value)
+        return f"(Store {self.slot} {self.value})"
 
     def __teal__(self, options: "CompileOptions"):
-        from ..ir import TealOp, Op, TealBlock
-
         op = TealOp(self, Op.store, self.slot)
         return TealBlock.FromOp(options, op, self.value)
 
@@ -146,6 +150,8 @@ class ScratchStackStore(Expr):
     doing.
     """
 
+    __slots__ = ("slot",)
+
     def __init__(self, slot: ScratchSlot):
         """Create a new ScratchStackStore expression.
 
@@ -156,11 +162,9 @@ class ScratchStackStore(Expr):
         self.slot = slot
 
     def __str__(self):
-        return "(StackStore {})".format(self.slot)
+        return f"(StackStore {self.slot})"
 
     def __teal__(self, options: "CompileOptions"):
-        from ..ir import TealOp, Op, TealBlock
-
         op = TealOp(self, Op.store, self.slot)
         return TealBlock.FromOp(options, op)
 
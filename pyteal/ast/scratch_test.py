@@ -31,6 +31,15 @@ def test_scratch_slot():
         )
 
 
+def test_scratch_slot_ids():
+    slots = [ScratchSlot() for _ in range(10)]
+    ids = [slot.id for slot in slots]
+
+    assert len(set(ids)) == len(ids)
+    assert all(id >= NUM_SLOTS for id in ids)
+    assert not any(slot.isReservedSlot for slot in slots)
+
+
 def test_scratch_load_default():
     slot = ScratchSlot()
     expr = ScratchLoad(slot)
@@ -106,3 +115,42 @@ def test_scratch_assign_id_invalid():
 
     with pytest.raises(TealInputError):
         slot = ScratchSlot(NUM_SLOTS)
+
+
+def test_scratch_reused_expr():
+    # The same expression object may appear several times in a program, so each call to
+    # __teal__ must produce new blocks that can be linked into the graph independently
+    slot = ScratchSlot()
+    for expr in (
+        ScratchLoad(slot),
+        ScratchStore(slot, Int(1)),
+        ScratchStackStore(slot),
+    ):
+        first, firstEnd = expr.__teal__(options)
+        second, secondEnd = expr.__teal__(options)
+
+        assert first is not second
+        assert firstEnd is not secondEnd
+        with TealComponent.Context.ignoreExprEquality():
+            assert first == second
+
+
+def test_scratch_reused_expr_ops():
+    # The compiler assigns slots by rewriting the args of each TealOp in place, so ops must not
+    # be shared between calls to __teal__
+    slot = ScratchSlot()
+    for expr in (
+        ScratchLoad(slot),
+        ScratchStore(slot, Int(1)),
+        ScratchStackStore(slot),
+    ):
+        _, firstEnd = expr.__teal__(options)
+        _, secondEnd = expr.__teal__(options)
+
+        firstOp = firstEnd.ops[-1]
+        secondOp = secondEnd.ops[-1]
+        assert firstOp is not secondOp
+
+        firstOp.assignSlot(slot, 0)
+        assert firstOp.args == [0]
+        assert secondOp.args == [slot]